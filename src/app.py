@@ -6,9 +6,17 @@ import numpy as np
 import base64
 import tempfile
 import os
+from functools import lru_cache
+from math import gcd
 from dotenv import load_dotenv
-
-from modules.image_analysis import pil_to_base64_dict, analyze_damage_image
+from scipy.signal import resample_poly
+
+from configs.load_config import APP_STEPS_CONFIGS
+from modules.image_analysis import (
+    pil_to_base64_dict,
+    analyze_damage_image,
+    prewarm_llm,
+)
 from modules.transcription import FireworksTranscription
 from modules.incident_processing import process_transcript_description
 from modules.claim_processing import generate_claim_report_pdf
@@ -18,6 +26,14 @@ load_dotenv()
 _FILE_PATH = Path(__file__).parents[1]
 
 
+@lru_cache(maxsize=8)
+def _resample_factors(sample_rate: int) -> tuple[int, int]:
+    """Reduced (up, down) factors to resample from sample_rate to the target rate"""
+    target = FireworksTranscription.TARGET_SAMPLE_RATE
+    g = gcd(target, sample_rate)
+    return target // g, sample_rate // g
+
+
 class ClaimsAssistantApp:
     def __init__(self):
         self.damage_analysis = None
@@ -362,11 +378,16 @@ class ClaimsAssistantApp:
                     if not isinstance(audio_data, np.ndarray):
                         audio_data = np.array(audio_data, dtype=np.float32)
 
+                    # Scale integer PCM straight into float32 in a single pass
                     if audio_data.dtype != np.float32:
                         if audio_data.dtype == np.int16:
-                            audio_data = audio_data.astype(np.float32) / 32768.0
+                            audio_data = np.multiply(
+                                audio_data, np.float32(1 / 32768), dtype=np.float32
+                            )
                         elif audio_data.dtype == np.int32:
-                            audio_data = audio_data.astype(np.float32) / 2147483648.0
+                            audio_data = np.multiply(
+                                audio_data, np.float32(1 / 2147483648), dtype=np.float32
+                            )
                         else:
                             audio_data = audio_data.astype(np.float32)
 
@@ -377,21 +398,21 @@ class ClaimsAssistantApp:
 
                     # Convert to mono if stereo
                     if len(audio_data.shape) > 1:
-                        audio_data = np.mean(audio_data, axis=1)
-
-                    # Resample to 16kHz if needed
-                    if sample_rate != 16000:
-                        ratio = 16000 / sample_rate
-                        new_length = int(len(audio_data) * ratio)
-                        if new_length > 0:
-                            audio_data = np.interp(
-                                np.linspace(0, len(audio_data) - 1, new_length),
-                                np.arange(len(audio_data)),
-                                audio_data,
-                            )
-
-                    # Convert to bytes and send to transcription service
-                    audio_bytes = (audio_data * 32767).astype(np.int16).tobytes()
+                        audio_data = audio_data.mean(axis=1, dtype=np.float32)
+
+                    # Resample to 16kHz if needed, with an anti-aliasing polyphase filter
+                    if sample_rate != FireworksTranscription.TARGET_SAMPLE_RATE:
+                        up, down = _resample_factors(sample_rate)
+                        audio_data = resample_poly(audio_data, up, down)
+
+                    # Quantize to int16: clip first (the resampling filter can overshoot
+                    # +/-1.0, which would otherwise wrap around), then round into the
+                    # int16 buffer directly
+                    scaled = np.multiply(audio_data, np.float32(32767))
+                    np.clip(scaled, -32768, 32767, out=scaled)
+                    pcm = np.empty(scaled.shape, dtype=np.int16)
+                    np.rint(scaled, out=pcm, casting="unsafe")
+                    audio_bytes = pcm.tobytes()
 
                     if (
                         self.transcription_service
@@ -629,5 +650,12 @@ def create_claims_app():
 # Create and launch the demo
 if __name__ == "__main__":
     print("Starting AI Claims Assistant Demo with Function Calling")
+    startup_api_key = os.getenv("FIREWORKS_API_KEY", "")
+    if startup_api_key:
+        for step in (
+            APP_STEPS_CONFIGS.analyze_damage_image,
+            APP_STEPS_CONFIGS.incident_response,
+        ):
+            prewarm_llm(startup_api_key, step.model, step.temperature)
     demo = create_claims_app()
     demo.launch()
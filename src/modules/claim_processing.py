@@ -1,20 +1,39 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Any, List, Optional, Tuple
 import io
+import logging
+import os
+import re
+from PIL import Image
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    Table,
-    TableStyle,
-    Image,
-)
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.platypus.flowables import HRFlowable
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+logger = logging.getLogger(__name__)
+
+
+# Fixed report layout (points)
+_PAGE_WIDTH, _PAGE_HEIGHT = letter
+_MARGIN = 0.75 * inch
+_CONTENT_WIDTH = _PAGE_WIDTH - 2 * _MARGIN
+_TABLE_WIDTH = 6.7 * inch
+_CELL_PADDING_X = 6
+_CELL_PADDING_Y = 4
+
+_FONT = "Helvetica"
+_FONT_BOLD = "Helvetica-Bold"
+_FONT_ITALIC = "Helvetica-Oblique"
+_FONT_SIZE = 10
+_LEADING = 12
+
+_PHOTO_WIDTH = 4 * inch
+_PHOTO_HEIGHT = 3 * inch
 
 
 def generate_claim_report_pdf(
@@ -33,13 +52,44 @@ def generate_claim_report_pdf(
     Returns:
         PDF bytes for the formatted claim report
     """
+    # BytesIO.getvalue() hands back its internal bytes without copying as
+    # long as no buffer views are held on it.
+    return generate_claim_report_pdf_stream(
+        damage_analysis, incident_data, image_path
+    ).getvalue()
+
+
+def generate_claim_report_pdf_stream(
+    damage_analysis: Dict[str, Any],
+    incident_data: Dict[str, Any],
+    image_path: str = None,
+) -> io.BytesIO:
+    """
+    Generate the claim report PDF into an in-memory stream.
+
+    Useful when the PDF is written to a file or streamed in a response, since
+    the caller can read from the buffer directly instead of holding a copy.
+
+    Args:
+        damage_analysis: Results from image damage analysis
+        incident_data: Processed incident data from transcript
+        image_path: Optional path to the damage photo to include in appendix
+
+    Returns:
+        BytesIO containing the PDF, positioned at the start
+    """
 
     # Create a BytesIO buffer to hold the PDF
     buffer = io.BytesIO()
 
     # Generate claim reference number
     timestamp = datetime.now()
-    claim_ref = f"CLM-{timestamp.strftime('%Y%m%d')}-{timestamp.strftime('%H%M%S')}"
+    claim_ref = (
+        f"CLM-{timestamp.year}{timestamp.month:02d}{timestamp.day:02d}"
+        f"-{timestamp.hour:02d}{timestamp.minute:02d}{timestamp.second:02d}"
+    )
+    report_generated_at = timestamp.strftime("%B %d, %Y at %I:%M %p")
+    processing_time = timestamp.strftime("%I:%M %p EST")
 
     # Extract key information safely
     damage_description = damage_analysis.get("description", "Vehicle damage detected")
@@ -50,561 +100,699 @@ def generate_claim_report_pdf(
     date_location = incident_data.get("date_location", {})
     # Convert relative dates to actual dates
     actual_date = _convert_relative_date(date_location.get("date", "Not specified"))
-    date_location_converted = {**date_location, "date": actual_date}
 
     parties_involved = incident_data.get("parties_involved", {})
     fault_assessment = incident_data.get("fault_assessment", {})
     incident_description = incident_data.get("incident_description", {})
     injuries_medical = incident_data.get("injuries_medical", {})
 
-    # Generate assessments
-    priority = _get_priority_level(
-        damage_severity, injuries_medical.get("anyone_injured", "no")
-    )
-    cost_estimate = _estimate_cost_range(damage_severity)
-    recommendation = _get_recommendation(
-        damage_severity, injuries_medical.get("anyone_injured", "no")
-    )
-
-    # Create PDF document with professional margins
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=letter,
-        rightMargin=0.75 * inch,
-        leftMargin=0.75 * inch,
-        topMargin=0.75 * inch,
-        bottomMargin=0.75 * inch,
-    )
-
-    # Get styles
-    styles = getSampleStyleSheet()
-
-    # Professional custom styles - all black text
-    title_style = ParagraphStyle(
-        "ProfessionalTitle",
-        parent=styles["Heading1"],
-        fontSize=20,
-        textColor=colors.black,
-        spaceAfter=16,
-        spaceBefore=0,
-        alignment=TA_CENTER,
-        fontName="Helvetica-Bold",
-    )
+    # Normalise the inputs every assessment branches on once
+    is_injured = injuries_medical.get("anyone_injured", "no").lower() == "yes"
+    severity_lower = damage_severity.lower()
+    injury_severity_lower = (injuries_medical.get("injury_severity") or "minor").lower()
+    # None means fault was not reported at all, which is distinct from a blank value
+    fault = fault_assessment.get("who_at_fault")
+    fault_lower = fault.lower() if fault is not None else None
 
-    header_style = ParagraphStyle(
-        "ProfessionalHeader",
-        parent=styles["Heading2"],
-        fontSize=14,
-        textColor=colors.black,
-        spaceAfter=8,
-        spaceBefore=16,
-        fontName="Helvetica-Bold",
-    )
-
-    subheader_style = ParagraphStyle(
-        "ProfessionalSubHeader",
-        parent=styles["Heading3"],
-        fontSize=12,
-        textColor=colors.black,
-        spaceAfter=6,
-        spaceBefore=8,
-        fontName="Helvetica-Bold",
+    # Generate assessments
+    (
+        priority,
+        cost_estimate,
+        recommendation,
+        medical_costs,
+        total_estimate,
+        fault_determination,
+    ) = _assess_claim(severity_lower, is_injured, injury_severity_lower, fault_lower)
+
+    summary_text = (
+        f"This claim involves a motor vehicle accident resulting in <b>{severity_lower}</b> damage to the "
+        f"insured vehicle's <b>{damage_location.replace('-', ' ').lower()}</b> area. Based on initial assessment "
+        "of submitted photographic evidence and incident description, this appears to be a legitimate claim "
+        f"{'requiring expedited processing due to reported injuries' if is_injured else 'suitable for standard processing procedures'}."
     )
 
-    body_style = ParagraphStyle(
-        "ProfessionalBody",
-        parent=styles["Normal"],
-        fontSize=10,
-        spaceAfter=4,
-        fontName="Helvetica",
-        textColor=colors.black,
-        alignment=TA_JUSTIFY,
+    processing_notes = (
+        "This preliminary assessment was generated using automated analysis tools to expedite initial claim processing. "
+        "Photographic evidence and incident descriptions were processed using artificial intelligence to provide rapid "
+        f"initial assessment. {'Given the reported injuries, this claim has been flagged for expedited human review.' if is_injured else 'Standard processing timeline applies per company guidelines.'} "
+        "Final claim determination requires licensed adjuster review and approval."
     )
 
-    # Professional table style
-    def create_professional_table_style():
-        return TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (0, -1), colors.lightgrey),
-                ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                ("FONTNAME", (1, 0), (1, -1), "Helvetica"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ("TOPPADDING", (0, 0), (-1, -1), 4),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ]
-        )
-
-    # Helper function to create table cells with proper text wrapping
-    def create_table_cell(text: str, is_header: bool = False) -> Paragraph:
-        style = ParagraphStyle(
-            "TableCell",
-            parent=styles["Normal"],
-            fontSize=10,
-            textColor=colors.black,
-            fontName="Helvetica-Bold" if is_header else "Helvetica",
-            leftIndent=0,
-            rightIndent=0,
-            spaceAfter=0,
-            spaceBefore=0,
-        )
-        return Paragraph(str(text), style)
-
-    # Build the document content
-    story = []
-
-    # Professional Header
-    story.append(Paragraph("AUTOMOBILE INSURANCE CLAIM REPORT", title_style))
-    story.append(Spacer(1, 12))
-
-    # Claim Information Section
-    claim_info_data = [
-        [
-            create_table_cell("Claim Reference Number:", True),
-            create_table_cell(claim_ref),
-        ],
-        [
-            create_table_cell("Report Generated:", True),
-            create_table_cell(timestamp.strftime("%B %d, %Y at %I:%M %p")),
+    ctx = {
+        "claim_info": [
+            ("Claim Reference Number:", claim_ref),
+            ("Report Generated:", report_generated_at),
+            ("Claim Status:", "Under Review - Pending Adjuster Assignment"),
+            ("Processing Priority:", priority),
         ],
-        [
-            create_table_cell("Claim Status:", True),
-            create_table_cell("Under Review - Pending Adjuster Assignment"),
-        ],
-        [
-            create_table_cell("Processing Priority:", True),
-            create_table_cell(
-                priority.replace("🔴", "").replace("🟡", "").replace("🟢", "").strip()
-            ),
-        ],
-    ]
-
-    claim_info_table = Table(claim_info_data, colWidths=[2.2 * inch, 4.5 * inch])
-    claim_info_table.setStyle(create_professional_table_style())
-    story.append(claim_info_table)
-    story.append(Spacer(1, 16))
-
-    # Executive Summary
-    story.append(Paragraph("EXECUTIVE SUMMARY", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
-
-    summary_text = f"""
-    This claim involves a motor vehicle accident resulting in <b>{damage_severity.lower()}</b> damage to the
-    insured vehicle's <b>{damage_location.replace('-', ' ').lower()}</b> area. Based on initial assessment
-    of submitted photographic evidence and incident description, this appears to be a legitimate claim
-    {"requiring expedited processing due to reported injuries" if injuries_medical.get('anyone_injured', 'no').lower() == 'yes' else "suitable for standard processing procedures"}.
-    <br/><br/>
-    <b>Primary Recommendation:</b> {recommendation}<br/>
-    <b>Preliminary Cost Assessment:</b> {cost_estimate}
-    """
-
-    story.append(Paragraph(summary_text, body_style))
-    story.append(Spacer(1, 16))
-
-    # Incident Details
-    story.append(Paragraph("INCIDENT DETAILS", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
-
-    # Date, Time & Location
-    story.append(Paragraph("Date, Time and Location of Loss", subheader_style))
-
-    incident_data_table = [
-        [
-            create_table_cell("Date of Loss:", True),
-            create_table_cell(
-                date_location_converted.get("date", "Not specified in report")
+        "summary": summary_text,
+        "recommendation": recommendation,
+        "cost_estimate": cost_estimate,
+        "incident": [
+            ("Date of Loss:", actual_date or "Not specified in report"),
+            ("Time of Loss:", date_location.get("time", "Not specified in report")),
+            (
+                "Location of Loss:",
+                date_location.get("location", "Not specified in report"),
             ),
         ],
-        [
-            create_table_cell("Time of Loss:", True),
-            create_table_cell(date_location.get("time", "Not specified in report")),
-        ],
-        [
-            create_table_cell("Location of Loss:", True),
-            create_table_cell(date_location.get("location", "Not specified in report")),
-        ],
-    ]
-
-    incident_table = Table(incident_data_table, colWidths=[2 * inch, 4.7 * inch])
-    incident_table.setStyle(create_professional_table_style())
-    story.append(incident_table)
-    story.append(Spacer(1, 12))
-
-    # Description of Incident
-    story.append(Paragraph("Description of Incident", subheader_style))
-    incident_desc = incident_description.get(
-        "what_happened", "No detailed description provided in initial report"
-    )
-    story.append(Paragraph(incident_desc, body_style))
-    story.append(Spacer(1, 16))
-
-    # Parties Involved
-    story.append(Paragraph("PARTIES INVOLVED", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
-
-    parties_data = [
-        [
-            create_table_cell("Other Party Driver Name:", True),
-            create_table_cell(
-                parties_involved.get("other_driver_name", "Information not provided")
+        "incident_description": incident_description.get(
+            "what_happened", "No detailed description provided in initial report"
+        ),
+        "parties": [
+            (
+                "Other Party Driver Name:",
+                parties_involved.get("other_driver_name", "Information not provided"),
             ),
-        ],
-        [
-            create_table_cell("Other Party Vehicle:", True),
-            create_table_cell(
-                parties_involved.get("other_driver_vehicle", "Information not provided")
+            (
+                "Other Party Vehicle:",
+                parties_involved.get(
+                    "other_driver_vehicle", "Information not provided"
+                ),
             ),
-        ],
-        [
-            create_table_cell("Witness Information:", True),
-            create_table_cell(
-                parties_involved.get("witnesses", "No witnesses reported at this time")
+            (
+                "Witness Information:",
+                parties_involved.get("witnesses", "No witnesses reported at this time"),
             ),
         ],
-    ]
-
-    parties_table = Table(parties_data, colWidths=[2 * inch, 4.7 * inch])
-    parties_table.setStyle(create_professional_table_style())
-    story.append(parties_table)
-    story.append(Spacer(1, 16))
-
-    # Vehicle Damage Assessment
-    story.append(Paragraph("VEHICLE DAMAGE ASSESSMENT", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
-
-    # Clean up damage description - wrap long text properly
-    damage_desc_clean = _format_damage_description(damage_description)
-
-    damage_data = [
-        [
-            create_table_cell("Damage Severity Classification:", True),
-            create_table_cell(damage_severity.title()),
-        ],
-        [
-            create_table_cell("Primary Damage Location:", True),
-            create_table_cell(damage_location.replace("-", " ").title()),
-        ],
-        [
-            create_table_cell("Damage Description:", True),
-            create_table_cell(damage_desc_clean),
+        "damage": [
+            ("Damage Severity Classification:", damage_severity.title()),
+            ("Primary Damage Location:", damage_location.replace("-", " ").title()),
+            ("Damage Description:", _format_damage_description(damage_description)),
+            ("Preliminary Repair Estimate:", cost_estimate),
         ],
-        [
-            create_table_cell("Preliminary Repair Estimate:", True),
-            create_table_cell(cost_estimate),
-        ],
-    ]
-
-    damage_table = Table(damage_data, colWidths=[2 * inch, 4.7 * inch])
-    damage_table.setStyle(create_professional_table_style())
-    story.append(damage_table)
-    story.append(Spacer(1, 12))
-
-    # Evidence Documentation
-    evidence_text = """
-    <b>Photographic Evidence:</b> Digital photographs of vehicle damage received and analyzed using automated assessment tools.<br/>
-    <b>Incident Documentation:</b> Verbal account transcribed and processed for key incident details.
-    """
-    story.append(Paragraph(evidence_text, body_style))
-    story.append(Spacer(1, 16))
-
-    # Injury and Medical Information
-    story.append(Paragraph("INJURY AND MEDICAL INFORMATION", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
-
-    injury_data = [
-        [
-            create_table_cell("Personal Injuries Reported:", True),
-            create_table_cell(
-                injuries_medical.get("anyone_injured", "Not specified").title()
+        "injury": [
+            (
+                "Personal Injuries Reported:",
+                injuries_medical.get("anyone_injured", "Not specified").title(),
             ),
-        ],
-        [
-            create_table_cell("Injury Details:", True),
-            create_table_cell(
+            (
+                "Injury Details:",
                 injuries_medical.get(
                     "injury_details", "No specific injury details provided"
-                )
+                ),
             ),
-        ],
-        [
-            create_table_cell("Medical Treatment Sought:", True),
-            create_table_cell(
-                injuries_medical.get("medical_attention", "Information not available")
+            (
+                "Medical Treatment Sought:",
+                injuries_medical.get("medical_attention", "Information not available"),
             ),
-        ],
-        [
-            create_table_cell("Injury Severity Assessment:", True),
-            create_table_cell(
-                injuries_medical.get("injury_severity", "None reported").title()
+            (
+                "Injury Severity Assessment:",
+                injuries_medical.get("injury_severity", "None reported").title(),
             ),
         ],
-    ]
-
-    injury_table = Table(injury_data, colWidths=[2 * inch, 4.7 * inch])
-    injury_table.setStyle(create_professional_table_style())
-    story.append(injury_table)
-    story.append(Spacer(1, 16))
-
-    # Liability Assessment
-    story.append(Paragraph("PRELIMINARY LIABILITY ASSESSMENT", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
-
-    fault_data = [
-        [
-            create_table_cell("Initial Fault Determination:", True),
-            create_table_cell(
-                _format_fault_determination(
-                    fault_assessment.get("who_at_fault", "Under investigation")
-                )
+        "fault": [
+            (
+                "Initial Fault Determination:",
+                fault_determination,
             ),
-        ],
-        [
-            create_table_cell("Basis for Determination:", True),
-            create_table_cell(
+            (
+                "Basis for Determination:",
                 fault_assessment.get(
                     "reason", "Pending detailed investigation and evidence review"
-                )
+                ),
             ),
         ],
-    ]
+        "cost": [
+            ("Vehicle Repair Estimate:", cost_estimate),
+            ("Medical Expense Estimate:", medical_costs),
+            ("Total Preliminary Estimate:", total_estimate),
+        ],
+        "next_steps": _generate_next_steps_professional(
+            severity_lower, is_injured, fault_lower
+        ),
+        "processing_notes": processing_notes,
+        "footer": [
+            ("Report Generated By:", "AI Claims Processing System"),
+            ("Processing Timestamp:", processing_time),
+            ("Human Review Status:", "Required - Pending Assignment"),
+            ("System Confidence Level:", "High - Standard Processing Recommended"),
+        ],
+        "raw_description": incident_description.get(
+            "what_happened", "No transcript available"
+        ),
+        "image_path": image_path,
+        "technical_analysis": _format_technical_description(
+            damage_analysis.get("description", "No technical analysis available")
+        ),
+    }
 
-    fault_table = Table(fault_data, colWidths=[2 * inch, 4.7 * inch])
-    fault_table.setStyle(create_professional_table_style())
-    story.append(fault_table)
-    story.append(Spacer(1, 16))
+    _render_claim_report_canvas(buffer, ctx)
+    buffer.seek(0)
 
-    # Cost Analysis
-    story.append(Paragraph("PRELIMINARY COST ANALYSIS", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
+    return buffer
 
-    medical_costs = _format_medical_costs(injuries_medical)
-    total_estimate = _calculate_total_estimate(cost_estimate, injuries_medical)
 
-    cost_data = [
-        [
-            create_table_cell("Vehicle Repair Estimate:", True),
-            create_table_cell(cost_estimate),
-        ],
-        [
-            create_table_cell("Medical Expense Estimate:", True),
-            create_table_cell(medical_costs),
-        ],
-        [
-            create_table_cell("Total Preliminary Estimate:", True),
-            create_table_cell(total_estimate),
-        ],
-    ]
+def generate_claim_report_pdf_batch(
+    jobs: List[Tuple[Dict[str, Any], Dict[str, Any], str]],
+    max_workers: int = None,
+) -> List[bytes]:
+    """
+    Generate several claim reports in parallel across worker processes.
 
-    cost_table = Table(cost_data, colWidths=[2 * inch, 4.7 * inch])
-    cost_style = create_professional_table_style()
-    # Highlight total row
-    cost_style.add("BACKGROUND", (0, 2), (1, 2), colors.lightgrey)
-    cost_style.add("FONTNAME", (0, 2), (1, 2), "Helvetica-Bold")
-    cost_table.setStyle(cost_style)
+    Report building is CPU-bound Python, so processes rather than threads are
+    used. The layout, assessment and image caches are per process and warm up
+    independently in each worker.
 
-    story.append(cost_table)
-    story.append(Spacer(1, 16))
+    Args:
+        jobs: (damage_analysis, incident_data, image_path) tuples, image_path may be None
+        max_workers: Number of worker processes, defaults to the CPU count
 
-    # Action Items and Next Steps
-    story.append(Paragraph("RECOMMENDED ACTION ITEMS", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
+    Returns:
+        PDF bytes for each job, in the same order as jobs
+    """
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(_generate_claim_report_pdf_job, jobs))
+
+
+def _generate_claim_report_pdf_job(
+    job: Tuple[Dict[str, Any], Dict[str, Any], str],
+) -> bytes:
+    damage_analysis, incident_data, image_path = job
+    return generate_claim_report_pdf(damage_analysis, incident_data, image_path)
+
+
+class _ReportCanvas:
+    """Top-down cursor over a ReportLab canvas for the fixed report layout"""
+
+    def __init__(self, buffer: io.BytesIO):
+        self.canvas = canvas.Canvas(buffer, pagesize=letter)
+        self.y = _PAGE_HEIGHT - _MARGIN
+
+    def ensure_space(self, height: float) -> None:
+        """Start a new page if the next block would run into the bottom margin"""
+        if self.y - height < _MARGIN:
+            self.canvas.showPage()
+            self.y = _PAGE_HEIGHT - _MARGIN
+
+    def space(self, height: float) -> None:
+        self.y -= height
+
+    def title(self, text: str) -> None:
+        self.ensure_space(20)
+        self.y -= 20
+        self.canvas.setFont(_FONT_BOLD, 20)
+        self.canvas.drawCentredString(_PAGE_WIDTH / 2, self.y, text)
+        self.y -= 16
+
+    def section(self, text: str) -> None:
+        self.y -= 16
+        # Keep the header, its rule and the first lines of content together
+        self.ensure_space(14 + 16 + 3 * _LEADING)
+        self.y -= 14
+        self.canvas.setFont(_FONT_BOLD, 14)
+        self.canvas.drawString(_MARGIN, self.y, text)
+        self.y -= 8
+        self.canvas.setLineWidth(1)
+        self.canvas.line(_MARGIN, self.y, _PAGE_WIDTH - _MARGIN, self.y)
+        self.y -= 8
+
+    def subsection(self, text: str) -> None:
+        self.y -= 8
+        self.ensure_space(12 + 6 + 2 * _LEADING)
+        self.y -= 12
+        self.canvas.setFont(_FONT_BOLD, 12)
+        self.canvas.drawString(_MARGIN, self.y, text)
+        self.y -= 6
+
+    def paragraph(
+        self,
+        text: str,
+        font: str = _FONT,
+        size: float = _FONT_SIZE,
+        label: str = None,
+        indent: float = 0,
+        centered: bool = False,
+        markup: bool = False,
+        static: bool = False,
+    ) -> None:
+        """
+        Draw wrapped, justified text, optionally led by a bold inline label.
+        With markup=True, <b>...</b> spans in the text are drawn in bold.
+        Pass static=True for fixed report text so its layout is cached.
+        """
+        width = _CONTENT_WIDTH - 2 * indent
+        leading = size * 1.2
+        label_width = _label_width(label, size) if label else 0
+        layout = _layout_static_paragraph if static else _layout_paragraph
+        lines = layout(
+            text,
+            font,
+            size,
+            width,
+            first_line_width=width - label_width,
+            justify=not centered,
+            markup=markup,
+        )
 
-    next_steps = _generate_next_steps_professional(
-        damage_severity, injuries_medical, fault_assessment
+        # One text object per paragraph (per page) keeps the whole block in a
+        # single BT/ET run instead of a separate text object for every line
+        text_obj = self.canvas.beginText()
+        text_obj.setFont(font, size)
+        for i, (runs, word_space) in enumerate(lines):
+            if self.y - leading < _MARGIN:
+                self.canvas.drawText(text_obj)
+                self.ensure_space(leading)
+                text_obj = self.canvas.beginText()
+                text_obj.setFont(font, size)
+            self.y -= leading
+            baseline = self.y + 0.25 * leading
+            x = _MARGIN + indent
+            if i == 0 and label:
+                text_obj.setFont(_FONT_BOLD, size)
+                text_obj.setTextOrigin(x, baseline)
+                text_obj.textOut(label)
+                text_obj.setFont(font, size)
+                x += label_width
+            if centered:
+                x = (_PAGE_WIDTH - stringWidth(runs[0][0], font, size)) / 2
+            text_obj.setTextOrigin(x, baseline)
+            if word_space:
+                text_obj.setWordSpace(word_space)
+            for run_text, run_font in runs:
+                if run_font != font:
+                    text_obj.setFont(run_font, size)
+                text_obj.textOut(run_text)
+                if run_font != font:
+                    text_obj.setFont(font, size)
+            if word_space:
+                text_obj.setWordSpace(0)
+        self.canvas.drawText(text_obj)
+
+    def table(
+        self,
+        rows: List[Tuple[str, str]],
+        label_width: float = 2 * inch,
+        highlight_last: bool = False,
+    ) -> None:
+        """Draw a two-column label/value grid with a shaded label column"""
+        c = self.canvas
+        value_width = _TABLE_WIDTH - label_width
+        x_label = _MARGIN
+        x_value = _MARGIN + label_width
+
+        for i, (label, value) in enumerate(rows):
+            highlight = highlight_last and i == len(rows) - 1
+            value_font = _FONT_BOLD if highlight else _FONT
+            label_lines = _wrap_static_text(
+                label, _FONT_BOLD, _FONT_SIZE, label_width - 2 * _CELL_PADDING_X
+            )
+            value_lines = _wrap_text(
+                str(value), value_font, _FONT_SIZE, value_width - 2 * _CELL_PADDING_X
+            )
+            height = (
+                max(len(label_lines), len(value_lines)) * _LEADING + 2 * _CELL_PADDING_Y
+            )
+            self.ensure_space(height)
+            top = self.y
+            bottom = top - height
+
+            c.setFillColor(colors.lightgrey)
+            c.rect(
+                x_label,
+                bottom,
+                _TABLE_WIDTH if highlight else label_width,
+                height,
+                stroke=0,
+                fill=1,
+            )
+            c.setFillColor(colors.black)
+
+            text_obj = c.beginText()
+            for font, x, lines in (
+                (_FONT_BOLD, x_label, label_lines),
+                (value_font, x_value, value_lines),
+            ):
+                text_obj.setFont(font, _FONT_SIZE, _LEADING)
+                text_obj.setTextOrigin(
+                    x + _CELL_PADDING_X, top - _CELL_PADDING_Y - _FONT_SIZE
+                )
+                text_obj.textLines(lines)
+            c.drawText(text_obj)
+
+            c.setLineWidth(1)
+            c.rect(x_label, bottom, _TABLE_WIDTH, height, stroke=1, fill=0)
+            c.line(x_value, bottom, x_value, top)
+            self.y = bottom
+
+    def image(self, source, width: float, height: float) -> None:
+        self.ensure_space(height)
+        # Only move the cursor once the image has been drawn successfully
+        self.canvas.drawImage(
+            source, (_PAGE_WIDTH - width) / 2, self.y - height, width, height
+        )
+        self.y -= height
+
+    def save(self) -> None:
+        self.canvas.save()
+
+
+def _prepare_claim_image(image_path: str) -> ImageReader:
+    """Load the damage photo downscaled for the report appendix"""
+    stat = os.stat(image_path)
+    return ImageReader(
+        io.BytesIO(_scaled_jpeg_bytes(image_path, stat.st_mtime_ns, stat.st_size))
     )
-    story.append(Paragraph(next_steps, body_style))
-    story.append(Spacer(1, 16))
 
-    # Processing Notes
-    story.append(Paragraph("PROCESSING NOTES", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
-
-    processing_notes = f"""
-    This preliminary assessment was generated using automated analysis tools to expedite initial claim processing.
-    Photographic evidence and incident descriptions were processed using artificial intelligence to provide rapid
-    initial assessment. {"Given the reported injuries, this claim has been flagged for expedited human review." if injuries_medical.get('anyone_injured', 'no').lower() == 'yes' else "Standard processing timeline applies per company guidelines."}
-    Final claim determination requires licensed adjuster review and approval.
+
+@lru_cache(maxsize=256)
+def _scaled_jpeg_bytes(image_path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Re-encode a photo at twice the printed resolution of the appendix slot.
+    Keyed on mtime and size so a replaced file is picked up again.
+    """
+    with Image.open(image_path) as img:
+        img = img.convert("RGB")
+        img.thumbnail(
+            (int(_PHOTO_WIDTH * 2), int(_PHOTO_HEIGHT * 2)),
+            Image.Resampling.LANCZOS,
+        )
+        buffered = io.BytesIO()
+        img.save(buffered, format="JPEG", quality=85)
+    return buffered.getvalue()
+
+
+def _wrap_text(
+    text: str, font: str, size: float, width: float, first_line_width: float = None
+) -> Tuple[str, ...]:
+    """Wrap text to a column width, honouring explicit line breaks"""
+    lines = []
+    for raw_line in str(text).split("\n"):
+        if first_line_width is not None and not lines and raw_line.strip():
+            # Shorter first line to make room for an inline label
+            first = simpleSplit(raw_line, font, size, first_line_width)[:1]
+            consumed = len(first[0].split()) if first else 0
+            rest = " ".join(raw_line.split()[consumed:])
+            lines.extend(first)
+            if rest:
+                lines.extend(simpleSplit(rest, font, size, width))
+            continue
+        lines.extend(simpleSplit(raw_line, font, size, width) or [""])
+    return tuple(lines) or ("",)
+
+
+_BOLD_MARKUP_RE = re.compile(r"<b>(.*?)</b>")
+
+
+def _layout_paragraph(
+    text: str,
+    font: str,
+    size: float,
+    width: float,
+    first_line_width: float,
+    justify: bool = True,
+    markup: bool = False,
+) -> Tuple[Tuple[Tuple[Tuple[str, str], ...], float], ...]:
+    """
+    Lay out a body paragraph as (runs, word_space) lines, where runs are
+    (text, font) pairs and word_space is the extra space per blank that
+    justifies the line. The last line before each break stays ragged.
     """
+    lines = []
+    for raw_line in str(text).split("\n"):
+        # Only the paragraph's first line is shortened for an inline label
+        first_width = first_line_width if not lines else None
+        line_width = width if first_width is None else first_width
+        if markup:
+            wrapped = _wrap_markup(raw_line, font, size, width, line_width)
+        else:
+            wrapped = tuple(
+                ((line, font),)
+                for line in _wrap_text(
+                    raw_line, font, size, width, first_line_width=first_width
+                )
+            )
+        for i, runs in enumerate(wrapped):
+            word_space = 0
+            if justify and i < len(wrapped) - 1:
+                blanks = sum(run_text.count(" ") for run_text, _ in runs)
+                natural = sum(stringWidth(t, f, size) for t, f in runs)
+                available = line_width if i == 0 else width
+                if blanks:
+                    word_space = max(0, (available - natural) / blanks)
+            lines.append((runs, word_space))
+    return tuple(lines)
+
+
+# Table labels and boilerplate paragraphs are identical in every report, so
+# their layout is measured once per process. Per-claim text (transcripts, LLM
+# output) rarely repeats and goes through the uncached functions above.
+_wrap_static_text = lru_cache(maxsize=128)(_wrap_text)
+_layout_static_paragraph = lru_cache(maxsize=128)(_layout_paragraph)
+
+
+def _wrap_markup(
+    text: str, font: str, size: float, width: float, first_line_width: float
+) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+    """Greedy word wrap of text containing <b>...</b> spans into font runs"""
+    words = []
+    for i, part in enumerate(_BOLD_MARKUP_RE.split(text)):
+        part_font = _FONT_BOLD if i % 2 else font
+        words.extend((word, part_font) for word in part.split())
+    if not words:
+        return ((("", font),),)
+
+    space_width = stringWidth(" ", font, size)
+    lines = []
+    current = []
+    current_width = 0
+    for word, word_font in words:
+        word_width = stringWidth(word, word_font, size)
+        limit = first_line_width if not lines else width
+        if current and current_width + space_width + word_width > limit:
+            lines.append(current)
+            current, current_width = [], 0
+        if current:
+            current_width += space_width
+        current.append((word, word_font))
+        current_width += word_width
+    lines.append(current)
+
+    # Merge consecutive words of the same font into runs, keeping the blanks
+    # between words inside the runs so word spacing can justify them
+    wrapped = []
+    for line in lines:
+        runs = []
+        for j, (word, word_font) in enumerate(line):
+            if j < len(line) - 1:
+                word += " "
+            if runs and runs[-1][1] == word_font:
+                runs[-1] = (runs[-1][0] + word, word_font)
+            else:
+                runs.append((word, word_font))
+        wrapped.append(tuple(runs))
+    return tuple(wrapped)
+
+
+@lru_cache(maxsize=128)
+def _label_width(label: str, size: float) -> float:
+    """Width of a bold inline label plus its trailing space"""
+    return stringWidth(f"{label} ", _FONT_BOLD, size)
+
+
+def _render_claim_report_canvas(buffer: io.BytesIO, ctx: Dict[str, Any]) -> None:
+    """Draw the fixed-layout claim report straight onto a canvas"""
+    report = _ReportCanvas(buffer)
 
-    story.append(Paragraph(processing_notes, body_style))
-    story.append(Spacer(1, 20))
+    # Professional Header
+    report.title("AUTOMOBILE INSURANCE CLAIM REPORT")
+    report.space(12)
+    report.table(ctx["claim_info"], label_width=2.2 * inch)
+    report.space(16)
 
-    # Footer Information
-    footer_data = [
-        [
-            create_table_cell("Report Generated By:", True),
-            create_table_cell("AI Claims Processing System"),
-        ],
-        [
-            create_table_cell("Processing Timestamp:", True),
-            create_table_cell(timestamp.strftime("%I:%M %p EST")),
-        ],
-        [
-            create_table_cell("Human Review Status:", True),
-            create_table_cell("Required - Pending Assignment"),
-        ],
-        [
-            create_table_cell("System Confidence Level:", True),
-            create_table_cell("High - Standard Processing Recommended"),
-        ],
-    ]
+    # Executive Summary
+    report.section("EXECUTIVE SUMMARY")
+    report.paragraph(ctx["summary"], markup=True)
+    report.space(_LEADING)
+    report.paragraph(ctx["recommendation"], label="Primary Recommendation:")
+    report.paragraph(ctx["cost_estimate"], label="Preliminary Cost Assessment:")
+    report.space(16)
 
-    footer_table = Table(footer_data, colWidths=[2 * inch, 4.7 * inch])
-    footer_table.setStyle(create_professional_table_style())
-    story.append(footer_table)
-    story.append(Spacer(1, 12))
+    # Incident Details
+    report.section("INCIDENT DETAILS")
+    report.subsection("Date, Time and Location of Loss")
+    report.table(ctx["incident"])
+    report.space(12)
+    report.subsection("Description of Incident")
+    report.paragraph(ctx["incident_description"])
+    report.space(16)
 
-    # Evidence/Appendix Section
-    story.append(Paragraph("APPENDIX - EVIDENCE DOCUMENTATION", header_style))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.black))
-    story.append(Spacer(1, 8))
+    # Parties Involved
+    report.section("PARTIES INVOLVED")
+    report.table(ctx["parties"])
+    report.space(16)
 
-    # Raw transcript section
-    story.append(Paragraph("Raw Incident Description Transcript", subheader_style))
+    # Vehicle Damage Assessment
+    report.section("VEHICLE DAMAGE ASSESSMENT")
+    report.table(ctx["damage"])
+    report.space(12)
 
-    # Get the original raw description
-    raw_description = incident_description.get(
-        "what_happened", "No transcript available"
+    # Evidence Documentation
+    report.paragraph(
+        "Digital photographs of vehicle damage received and analyzed using automated assessment tools.",
+        label="Photographic Evidence:",
+        static=True,
     )
+    report.paragraph(
+        "Verbal account transcribed and processed for key incident details.",
+        label="Incident Documentation:",
+        static=True,
+    )
+    report.space(16)
 
-    # Create a formatted transcript
-    transcript_text = f"""
-    <b>Original Incident Account (Unedited):</b><br/><br/>
-    "{raw_description}"
-    <br/><br/>
-    <i>Note: This is the unedited transcript of the policyholder's account of the incident as provided during initial report.</i>
-    """
+    # Injury and Medical Information
+    report.section("INJURY AND MEDICAL INFORMATION")
+    report.table(ctx["injury"])
+    report.space(16)
 
-    story.append(Paragraph(transcript_text, body_style))
-    story.append(Spacer(1, 12))
+    # Liability Assessment
+    report.section("PRELIMINARY LIABILITY ASSESSMENT")
+    report.table(ctx["fault"])
+    report.space(16)
+
+    # Cost Analysis
+    report.section("PRELIMINARY COST ANALYSIS")
+    report.table(ctx["cost"], highlight_last=True)
+    report.space(16)
+
+    # Action Items and Next Steps
+    report.section("RECOMMENDED ACTION ITEMS")
+    for label, text in ctx["next_steps"]:
+        report.paragraph(text, label=label)
+    report.space(16)
+
+    # Processing Notes
+    report.section("PROCESSING NOTES")
+    report.paragraph(ctx["processing_notes"])
+    report.space(20)
+
+    # Footer Information
+    report.table(ctx["footer"])
+    report.space(12)
+
+    # Evidence/Appendix Section
+    report.section("APPENDIX - EVIDENCE DOCUMENTATION")
+
+    # Raw transcript section
+    report.subsection("Raw Incident Description Transcript")
+    report.paragraph(
+        "Original Incident Account (Unedited):", font=_FONT_BOLD, static=True
+    )
+    report.space(_LEADING)
+    report.paragraph(f'"{ctx["raw_description"]}"')
+    report.space(_LEADING)
+    report.paragraph(
+        "Note: This is the unedited transcript of the policyholder's account of the incident as provided during initial report.",
+        font=_FONT_ITALIC,
+        static=True,
+    )
+    report.space(12)
 
     # Damage photo section
-    story.append(Paragraph("Photographic Evidence", subheader_style))
+    report.subsection("Photographic Evidence")
 
-    if image_path:
+    if ctx["image_path"]:
         try:
             # Add the damage photo
-            img = Image(image_path, width=4 * inch, height=3 * inch)
-            story.append(img)
-            story.append(Spacer(1, 8))
-
-            photo_caption = Paragraph(
-                "<i>Figure 1: Vehicle damage photograph submitted with initial claim report. "
-                "Image analyzed using automated damage assessment tools.</i>",
-                ParagraphStyle(
-                    "PhotoCaption",
-                    parent=styles["Normal"],
-                    fontSize=9,
-                    textColor=colors.black,
-                    alignment=TA_CENTER,
-                    spaceAfter=8,
-                ),
+            report.image(
+                _prepare_claim_image(ctx["image_path"]),
+                width=_PHOTO_WIDTH,
+                height=_PHOTO_HEIGHT,
+            )
+            report.space(8)
+            report.paragraph(
+                "Figure 1: Vehicle damage photograph submitted with initial claim report. "
+                "Image analyzed using automated damage assessment tools.",
+                font=_FONT_ITALIC,
+                size=9,
+                centered=True,
+                static=True,
             )
-            story.append(photo_caption)
         except Exception as e:
             # If image can't be loaded, show placeholder text
-            print(f"Error loading damage photo: {e}")
-            story.append(
-                Paragraph(
-                    "Damage photograph submitted with claim (unable to display in this report format).",
-                    body_style,
-                )
+            logger.warning("Error loading damage photo: %s", e)
+            report.paragraph(
+                "Damage photograph submitted with claim (unable to display in this report format).",
+                static=True,
             )
     else:
-        story.append(
-            Paragraph(
-                "Damage photograph submitted with claim and analyzed using automated assessment tools. "
-                "Original digital file maintained in claim documentation system.",
-                body_style,
-            )
+        report.paragraph(
+            "Damage photograph submitted with claim and analyzed using automated assessment tools. "
+            "Original digital file maintained in claim documentation system.",
+            static=True,
         )
 
-    story.append(Spacer(1, 12))
+    report.space(12)
 
     # Raw damage analysis
-    story.append(Paragraph("Technical Damage Analysis Output", subheader_style))
-
-    # Get the raw damage description
-    raw_damage_analysis = damage_analysis.get(
-        "description", "No technical analysis available"
+    report.subsection("Technical Damage Analysis Output")
+    report.paragraph(
+        "Automated Damage Assessment Output (Technical):",
+        font=_FONT_BOLD,
+        static=True,
     )
-
-    technical_analysis_text = f"""
-    <b>Automated Damage Assessment Output (Technical):</b><br/><br/>
-    {_format_technical_description(raw_damage_analysis)}
-    <br/><br/>
-    <i>Note: This is the raw output from the automated damage assessment system.
-    The summary version appears in the main report above.</i>
-    """
-
-    story.append(Paragraph(technical_analysis_text, body_style))
-    story.append(Spacer(1, 16))
+    report.space(_LEADING)
+    report.paragraph(ctx["technical_analysis"])
+    report.space(_LEADING)
+    report.paragraph(
+        "Note: This is the raw output from the automated damage assessment system. "
+        "The summary version appears in the main report above.",
+        font=_FONT_ITALIC,
+        static=True,
+    )
+    report.space(16)
 
     # Legal Disclaimer
-    disclaimer = Paragraph(
-        "<i>This automated preliminary assessment is provided for initial processing purposes only. "
+    report.paragraph(
+        "This automated preliminary assessment is provided for initial processing purposes only. "
         "All claim determinations are subject to policy terms, conditions, and coverage verification. "
-        "Final settlement authority rests with assigned licensed adjuster pending completion of full investigation.</i>",
-        ParagraphStyle(
-            "Disclaimer",
-            parent=styles["Normal"],
-            fontSize=8,
-            textColor=colors.black,
-            alignment=TA_CENTER,
-            leftIndent=0.5 * inch,
-            rightIndent=0.5 * inch,
-        ),
+        "Final settlement authority rests with assigned licensed adjuster pending completion of full investigation.",
+        font=_FONT_ITALIC,
+        size=8,
+        indent=0.5 * inch,
+        centered=True,
+        static=True,
     )
-    story.append(disclaimer)
 
-    # Build PDF
-    doc.build(story)
+    report.save()
+
+
+# Markdown noise in raw LLM output, removed in a single pass. "- **" is listed
+# first so list items become bullets before the bold markers are stripped.
+_MARKDOWN_CLEANUP_RE = re.compile(r"- \*\*|###|\*\*")
+_SECTION_BREAK_RE = re.compile(r"\n\s*\n")
+
 
-    # Get the PDF bytes
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
+def _markdown_cleanup_repl(match: re.Match) -> str:
+    return "• " if match.group(0) == "- **" else ""
 
-    return pdf_bytes
 
+def _strip_markdown_repl(match: re.Match) -> str:
+    return "- " if match.group(0) == "- **" else ""
 
+
+@lru_cache(maxsize=1024)
 def _format_damage_description(description: str) -> str:
     """Clean and format damage description for professional presentation"""
     if not description or len(description) < 50:
         return description
 
     # Remove redundant technical formatting
-    cleaned = description.replace("###", "").replace("**", "").replace("- **", "• ")
+    cleaned = _MARKDOWN_CLEANUP_RE.sub(_markdown_cleanup_repl, description)
 
     # Extract key summary if description is very long
     if len(cleaned) > 300:
-        lines = cleaned.split("\n")
         summary_lines = [
-            line.strip()
-            for line in lines
-            if line.strip()
-            and not line.strip().startswith("##")
-            and len(line.strip()) > 10
-        ][:3]
-        return " ".join(summary_lines[:2]) + "..."
+            stripped
+            for line in cleaned.splitlines()
+            if len(stripped := line.strip()) > 10 and not stripped.startswith("##")
+        ][:2]
+        return " ".join(summary_lines) + "..."
 
     return cleaned[:250] + "..." if len(cleaned) > 250 else cleaned
 
 
-def _format_fault_determination(fault: str) -> str:
+def _format_fault_determination(fault_lower: Optional[str]) -> str:
     """Format fault determination for professional presentation"""
     fault_map = {
         "other_driver": "Other Party - Preliminary",
@@ -612,22 +800,22 @@ def _format_fault_determination(fault: str) -> str:
         "unclear": "Undetermined - Investigation Required",
         "both": "Comparative Negligence - Investigation Required",
     }
-    return fault_map.get(fault.lower(), "Under Investigation")
+    return fault_map.get(fault_lower, "Under Investigation")
 
 
-def _get_priority_level(damage_severity: str, injuries_reported: str) -> str:
+def _get_priority_level(severity_lower: str, is_injured: bool) -> str:
     """Determine claim priority using professional terminology"""
-    if injuries_reported.lower() == "yes":
+    if is_injured:
         return "HIGH PRIORITY - Personal Injury Claim"
-    elif damage_severity.lower() == "major":
+    elif severity_lower == "major":
         return "ELEVATED PRIORITY - Significant Property Damage"
-    elif damage_severity.lower() == "moderate":
+    elif severity_lower == "moderate":
         return "STANDARD PRIORITY - Moderate Property Damage"
     else:
         return "ROUTINE PRIORITY - Minor Property Damage"
 
 
-def _estimate_cost_range(damage_severity: str) -> str:
+def _estimate_cost_range(severity_lower: str) -> str:
     """Estimate repair costs based on damage severity"""
     severity_costs = {
         "minor": "$750 - $2,500",
@@ -635,92 +823,161 @@ def _estimate_cost_range(damage_severity: str) -> str:
         "major": "$7,500 - $18,000",
         "severe": "$18,000 - $35,000",
     }
-    return severity_costs.get(damage_severity.lower(), "$2,000 - $5,000")
+    return severity_costs.get(severity_lower, "$2,000 - $5,000")
 
 
-def _get_recommendation(damage_severity: str, injuries_reported: str) -> str:
+def _get_recommendation(severity_lower: str, is_injured: bool) -> str:
     """Generate professional recommendation"""
-    if injuries_reported.lower() == "yes":
+    if is_injured:
         return "IMMEDIATE ACTION REQUIRED: Assign specialist adjuster for personal injury claim within 24 hours"
-    elif damage_severity.lower() in ["major", "severe"]:
+    elif severity_lower in ["major", "severe"]:
         return "PRIORITY PROCESSING: Schedule comprehensive inspection within 48 hours"
     else:
         return "STANDARD PROCESSING: Assign adjuster within normal service level agreement timeframe"
 
 
-def _format_medical_costs(injuries_medical: Dict[str, Any]) -> str:
+def _format_medical_costs(is_injured: bool, injury_severity_lower: str) -> str:
     """Format medical cost estimate professionally"""
-    if injuries_medical.get("anyone_injured", "no").lower() == "yes":
-        severity = injuries_medical.get("injury_severity", "minor").lower()
-        if severity == "severe":
+    if is_injured:
+        if injury_severity_lower == "severe":
             return "$15,000 - $75,000 (Preliminary)"
-        elif severity == "moderate":
+        elif injury_severity_lower == "moderate":
             return "$3,000 - $15,000 (Preliminary)"
         else:
             return "$500 - $3,000 (Preliminary)"
     return "No medical expenses anticipated"
 
 
-def _calculate_total_estimate(
-    repair_cost: str, injuries_medical: Dict[str, Any]
-) -> str:
+def _calculate_total_estimate(repair_cost: str, is_injured: bool) -> str:
     """Calculate total claim estimate professionally"""
-    if injuries_medical.get("anyone_injured", "no").lower() == "yes":
+    if is_injured:
         return f"{repair_cost} plus medical expenses (subject to investigation)"
     return repair_cost
 
 
+def _compute_assessment(
+    severity_lower: str,
+    is_injured: bool,
+    injury_severity_lower: str,
+    fault_lower: Optional[str],
+) -> Tuple[str, str, str, str, str, str]:
+    """Run every assessment helper for one combination of claim inputs"""
+    cost_estimate = _estimate_cost_range(severity_lower)
+    return (
+        _get_priority_level(severity_lower, is_injured),
+        cost_estimate,
+        _get_recommendation(severity_lower, is_injured),
+        _format_medical_costs(is_injured, injury_severity_lower),
+        _calculate_total_estimate(cost_estimate, is_injured),
+        _format_fault_determination(fault_lower),
+    )
+
+
+def _build_assessment_table() -> (
+    Dict[Tuple[str, bool, str, Optional[str]], Tuple[str, ...]]
+):
+    """Precompute assessments for every known severity/injury/fault combination"""
+    return {
+        key: _compute_assessment(*key)
+        for key in product(
+            ["minor", "moderate", "major", "severe"],
+            [True, False],
+            ["none", "minor", "moderate", "severe", "unclear"],
+            ["me", "other_driver", "policyholder", "unclear", "both", "", None],
+        )
+    }
+
+
+def _assess_claim(
+    severity_lower: str,
+    is_injured: bool,
+    injury_severity_lower: str,
+    fault_lower: Optional[str],
+) -> Tuple[str, str, str, str, str, str]:
+    """
+    Look up priority, repair estimate, recommendation, medical costs, total
+    estimate and fault determination, falling back to the helpers for
+    inputs outside the precomputed table.
+    """
+    key = (severity_lower, is_injured, injury_severity_lower, fault_lower)
+    assessment = _ASSESSMENT_TABLE.get(key)
+    if assessment is None:
+        assessment = _compute_assessment(*key)
+    return assessment
+
+
 def _generate_next_steps_professional(
-    damage_severity: str,
-    injuries_medical: Dict[str, Any],
-    fault_assessment: Dict[str, Any],
-) -> str:
-    """Generate professional action items"""
+    severity_lower: str,
+    is_injured: bool,
+    fault_lower: Optional[str],
+) -> List[Tuple[str, str]]:
+    """Generate professional action items as (numbered label, description) pairs"""
 
     steps = []
 
     # Always required steps
     steps.append(
-        "1. <b>Adjuster Assignment:</b> Assign licensed adjuster for detailed investigation and coverage verification."
+        (
+            "Adjuster Assignment:",
+            "Assign licensed adjuster for detailed investigation and coverage verification.",
+        )
     )
     steps.append(
-        "2. <b>Vehicle Inspection:</b> Schedule comprehensive damage assessment with approved appraiser."
+        (
+            "Vehicle Inspection:",
+            "Schedule comprehensive damage assessment with approved appraiser.",
+        )
     )
     steps.append(
-        "3. <b>Third Party Contact:</b> Attempt contact with other party's insurance carrier for coordination."
+        (
+            "Third Party Contact:",
+            "Attempt contact with other party's insurance carrier for coordination.",
+        )
     )
 
     # Conditional steps based on circumstances
-    step_num = 4
-
-    if injuries_medical.get("anyone_injured", "no").lower() == "yes":
+    if is_injured:
         steps.append(
-            f"{step_num}. <b>Medical Documentation:</b> Request medical records and treatment documentation from healthcare providers."
+            (
+                "Medical Documentation:",
+                "Request medical records and treatment documentation from healthcare providers.",
+            )
         )
-        step_num += 1
         steps.append(
-            f"{step_num}. <b>Injury Specialist:</b> Engage personal injury specialist for claim evaluation."
+            (
+                "Injury Specialist:",
+                "Engage personal injury specialist for claim evaluation.",
+            )
         )
-        step_num += 1
 
-    if fault_assessment.get("who_at_fault", "unclear").lower() == "unclear":
+    if fault_lower is None or fault_lower == "unclear":
         steps.append(
-            f"{step_num}. <b>Police Report:</b> Obtain official police report if available for liability determination."
+            (
+                "Police Report:",
+                "Obtain official police report if available for liability determination.",
+            )
         )
-        step_num += 1
 
-    if damage_severity.lower() in ["major", "severe"]:
+    if severity_lower in ["major", "severe"]:
         steps.append(
-            f"{step_num}. <b>Multiple Estimates:</b> Secure at least two independent repair estimates for cost validation."
+            (
+                "Multiple Estimates:",
+                "Secure at least two independent repair estimates for cost validation.",
+            )
         )
-        step_num += 1
 
     # Final step
     steps.append(
-        f"{step_num}. <b>Customer Communication:</b> Contact policyholder within 24 hours to confirm receipt and outline next steps."
+        (
+            "Customer Communication:",
+            "Contact policyholder within 24 hours to confirm receipt and outline next steps.",
+        )
     )
 
-    return "<br/>".join(steps)
+    return [
+        (f"{step_num}. {label}", text)
+        for step_num, (label, text) in enumerate(steps, start=1)
+    ]
 
 
 def _convert_relative_date(date_str: str) -> str:
@@ -766,18 +1023,19 @@ def _convert_relative_date(date_str: str) -> str:
     return date_str
 
 
+@lru_cache(maxsize=1024)
 def _format_technical_description(description: str) -> str:
     """Format technical damage description for appendix"""
     if not description:
         return "No technical analysis data available"
 
     # Clean up technical formatting but preserve more detail than main report
-    cleaned = description.replace("###", "").replace("**", "")
+    cleaned = _MARKDOWN_CLEANUP_RE.sub(_strip_markdown_repl, description)
 
     # If it's very long, keep more content than the main report version
     if len(cleaned) > 800:
         # Split into sections and keep first few sections
-        sections = cleaned.split("\n\n")
+        sections = _SECTION_BREAK_RE.split(cleaned)
         important_sections = [
             s.strip() for s in sections if s.strip() and len(s.strip()) > 20
         ]
@@ -787,3 +1045,6 @@ def _format_technical_description(description: str) -> str:
         )
 
     return cleaned
+
+
+_ASSESSMENT_TABLE = _build_assessment_table()
@@ -1,12 +1,20 @@
-import json
-from typing import Literal
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Literal
 
+import orjson
 from fireworks.llm import LLM
-from src.configs.load_config import PROMPT_LIBRARY, APP_STEPS_CONFIGS
+from PIL import Image
+from configs.load_config import PROMPT_LIBRARY, APP_STEPS_CONFIGS
+from modules.response_cache import ResponseCache
 from pydantic import BaseModel
 import io
 import base64
 
+logger = logging.getLogger(__name__)
+
 
 class IncidentAnalysis(BaseModel):
     description: str
@@ -15,7 +23,19 @@ class IncidentAnalysis(BaseModel):
     license_plate: str
 
 
+_INCIDENT_SCHEMA = IncidentAnalysis.model_json_schema()
+_RESPONSE_FORMAT = {"type": "json_object", "schema": _INCIDENT_SCHEMA}
+_VISION_PROMPTS = PROMPT_LIBRARY["vision_damage_analysis"]
+
+
+@lru_cache(maxsize=16)
 def get_llm(api_key: str, model: str, temperature: float) -> LLM:
+    """
+    Return a shared LLM client for this key, model and temperature.
+
+    Reusing the client keeps its HTTP connection pool warm across requests
+    instead of paying a new TCP and TLS handshake on every call.
+    """
     return LLM(
         model=model,
         temperature=temperature,
@@ -24,17 +44,65 @@ def get_llm(api_key: str, model: str, temperature: float) -> LLM:
     )
 
 
+def prewarm_llm(api_key: str, model: str, temperature: float) -> threading.Thread:
+    """
+    Open the client connection for a model in the background.
+
+    Sends a 1-token completion through the shared client so the TLS handshake
+    is done before the first real request. Failures are logged as warnings and
+    do not stop the app.
+    """
+
+    def _warm():
+        try:
+            llm = get_llm(api_key=api_key, model=model, temperature=temperature)
+            llm.chat.completions.create(
+                messages=[{"role": "user", "content": "ping"}], max_tokens=1
+            )
+        except Exception as e:
+            logger.warning("LLM prewarm failed for %s: %s", model, e)
+
+    thread = threading.Thread(target=_warm, name="llm-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+# Identical uploads (retries, re-clicks) reuse the previous analysis
+_DAMAGE_ANALYSIS_CACHE = ResponseCache(maxsize=128)
+
+# The VLM resizes images server-side, so anything larger only costs upload time
+MAX_UPLOAD_EDGE = 1024
+
+
+def _downscale_for_upload(pil_image):
+    """Fit the image within MAX_UPLOAD_EDGE without modifying the original"""
+    if max(pil_image.size) <= MAX_UPLOAD_EDGE:
+        return pil_image
+
+    scaled = pil_image.copy()
+    scaled.thumbnail((MAX_UPLOAD_EDGE, MAX_UPLOAD_EDGE), Image.Resampling.LANCZOS)
+    return scaled
+
+
+def _encode_jpeg_base64(pil_image, quality: int = 80) -> str:
+    """JPEG-encode an RGB PIL image and return it base64 encoded"""
+    buffered = io.BytesIO()
+    pil_image.save(
+        buffered, format="JPEG", quality=quality, optimize=True, progressive=True
+    )
+    # getbuffer() exposes the encoded bytes without copying them out first
+    return base64.b64encode(buffered.getbuffer()).decode("ascii")
+
+
 def pil_to_base64_dict(pil_image):
     """Convert PIL image to the format expected by analyze_damage_image"""
     if pil_image is None:
         return None
 
-    buffered = io.BytesIO()
     if pil_image.mode != "RGB":
         pil_image = pil_image.convert("RGB")
 
-    pil_image.save(buffered, format="JPEG")
-    img_base64 = base64.b64encode(buffered.getvalue()).decode("utf-8")
+    img_base64 = _encode_jpeg_base64(_downscale_for_upload(pil_image))
 
     return {"image": pil_image, "path": "uploaded_image.jpg", "base64": img_base64}
 
@@ -43,17 +111,20 @@ def analyze_damage_image(image, api_key: str, prompt: str = "advanced"):
     """
     Analyze the damage in an image using the Fireworks VLM model.
     """
+    prompt_text = _VISION_PROMPTS.get(prompt)
     assert (
-        prompt in PROMPT_LIBRARY["vision_damage_analysis"].keys()
-    ), f"Invalid prompt choose from {list(PROMPT_LIBRARY['vision_damage_analysis'].keys())}"
+        prompt_text is not None
+    ), f"Invalid prompt choose from {list(_VISION_PROMPTS.keys())}"
 
-    prompt_text = PROMPT_LIBRARY["vision_damage_analysis"][prompt]
+    model = APP_STEPS_CONFIGS.analyze_damage_image.model
+    temperature = APP_STEPS_CONFIGS.analyze_damage_image.temperature
 
-    llm = get_llm(
-        api_key=api_key,
-        model=APP_STEPS_CONFIGS.analyze_damage_image.model,
-        temperature=APP_STEPS_CONFIGS.analyze_damage_image.temperature,
-    )
+    cache_key = ResponseCache.make_key(model, temperature, prompt_text, image["base64"])
+    cached = _DAMAGE_ANALYSIS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    llm = get_llm(api_key=api_key, model=model, temperature=temperature)
     response = llm.chat.completions.create(
         messages=[
             {
@@ -69,11 +140,35 @@ def analyze_damage_image(image, api_key: str, prompt: str = "advanced"):
                 ],
             }
         ],
-        response_format={
-            "type": "json_object",
-            "schema": IncidentAnalysis.model_json_schema(),
-        },
+        response_format=_RESPONSE_FORMAT,
     )
 
-    result = json.loads(response.choices[0].message.content)
+    result = orjson.loads(response.choices[0].message.content)
+    _DAMAGE_ANALYSIS_CACHE.set(cache_key, result)
     return result
+
+
+def analyze_damage_images(
+    images: List[dict], api_key: str, prompt: str = "advanced", max_workers: int = 8
+) -> List[dict]:
+    """
+    Analyze several damage images concurrently.
+
+    Args:
+        images: image dicts as returned by pil_to_base64_dict
+        api_key: api key to use
+        prompt: vision prompt name
+        max_workers: maximum number of requests in flight
+
+    Returns:
+        results: one analysis per image, in the same order as images
+    """
+    if len(images) <= 1:
+        return [analyze_damage_image(image, api_key, prompt) for image in images]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as executor:
+        return list(
+            executor.map(
+                lambda image: analyze_damage_image(image, api_key, prompt), images
+            )
+        )
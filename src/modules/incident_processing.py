@@ -1,11 +1,17 @@
 from modules.image_analysis import get_llm
-from src.configs.load_config import PROMPT_LIBRARY, APP_STEPS_CONFIGS
-from pydantic import BaseModel
+from modules.response_cache import ResponseCache
+from configs.load_config import PROMPT_LIBRARY, APP_STEPS_CONFIGS
+from pydantic import BaseModel, ValidationError
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Literal, List, Dict, Any
-import json
+import logging
+import os
 import random
 import time
 
+logger = logging.getLogger(__name__)
+
 
 class DateLocation(BaseModel):
     date: Optional[str] = None
@@ -53,9 +59,15 @@ class IncidentAnalysis(BaseModel):
     external_data_retrieved: Dict[str, Any] = {}
 
 
+_INCIDENT_SCHEMA = IncidentAnalysis.model_json_schema()
+_RESPONSE_FORMAT = {"type": "json_object", "schema": _INCIDENT_SCHEMA}
+
+
 def mock_weather_lookup(date: str, location: str) -> Dict[str, Any]:
     """Mock function to look up weather conditions for a specific date and location"""
-    time.sleep(0.5)  # Simulate API call delay
+    simulate_latency = os.environ.get("SCOUT_SIMULATE_LATENCY", "").strip().lower()
+    if simulate_latency in {"1", "true", "yes"}:
+        time.sleep(0.5)  # Simulate API call delay
 
     weather_conditions = [
         "Clear",
@@ -134,6 +146,53 @@ AVAILABLE_FUNCTIONS = {
 }
 
 
+# Re-submitting the same transcript reuses the previous analysis
+_INCIDENT_ANALYSIS_CACHE = ResponseCache(maxsize=128)
+
+# OpenAI-style tool specs passed to the model; "function" stays client-side
+TOOL_SPECS = [
+    {
+        "type": "function",
+        "function": {k: v for k, v in spec.items() if k != "function"},
+    }
+    for spec in AVAILABLE_FUNCTIONS.values()
+]
+
+
+# The prompt around the transcript is static, so it is assembled once
+_PROMPT_PREFIX = f"""
+{PROMPT_LIBRARY["incident_processing"]["advanced"]}
+
+**ADDITIONAL CAPABILITIES:**
+You have access to tools that can gather additional context for the claim.
+Call them when the transcript provides their required inputs, for example the weather for a known
+date and location, or a record check for a named other driver.
+Incorporate any tool results into your final analysis, for example:
+- Weather conditions might affect fault assessment
+- Driver record might influence risk assessment
+
+**TRANSCRIPT TO ANALYZE:**
+<transcript>
+"""
+_PROMPT_SUFFIX = """
+</transcript>
+"""
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert automotive claims adjuster analyzing vehicle damage with access to external data sources.",
+}
+
+
+def _parse_tool_arguments(arguments) -> Dict[str, Any]:
+    """Decode tool call arguments, which may arrive as a JSON string or a dict"""
+    if isinstance(arguments, dict):
+        return arguments
+    try:
+        return orjson.loads(arguments or "{}")
+    except ValueError:
+        return {}
+
+
 def execute_function_call(
     function_name: str, parameters: Dict[str, Any]
 ) -> FunctionCallResult:
@@ -166,10 +225,32 @@ def execute_function_call(
         )
 
 
+def execute_function_calls(calls: List[Dict[str, Any]]) -> List[FunctionCallResult]:
+    """
+    Execute independent function calls concurrently.
+
+    Args:
+        calls: list of {"name": ..., "params": ...} dicts
+
+    Returns:
+        results: one FunctionCallResult per call, in the same order as calls
+    """
+    if len(calls) <= 1:
+        return [execute_function_call(call["name"], call["params"]) for call in calls]
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        return list(
+            executor.map(
+                lambda call: execute_function_call(call["name"], call["params"]),
+                calls,
+            )
+        )
+
+
 def process_transcript_description(transcript: str, api_key: str):
     """
     Analyze the provided transcript and extract structured information for insurance claim processing.
-    Now includes function calling capabilities to gather additional context.
+    The model can call tools to gather additional context, which is fed back in the same conversation.
 
     Args:
         transcript: transcript string to process
@@ -178,160 +259,108 @@ def process_transcript_description(transcript: str, api_key: str):
     Returns:
         incident_description: incident description with function call results
     """
-    print("Starting incident analysis with function calling...")
-
-    llm = get_llm(
-        api_key=api_key,
-        model="accounts/fireworks/models/llama4-scout-instruct-basic",
-        temperature=APP_STEPS_CONFIGS.incident_response.temperature,
-    )
+    model = APP_STEPS_CONFIGS.incident_response.model
+    temperature = APP_STEPS_CONFIGS.incident_response.temperature
 
-    # Enhanced prompt that includes function calling
-    prompt_text = f"""
-    {PROMPT_LIBRARY["incident_processing"]["advanced"]}
+    cache_key = ResponseCache.make_key(model, temperature, _PROMPT_PREFIX, transcript)
+    cached = _INCIDENT_ANALYSIS_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Reusing cached incident analysis")
+        return cached
 
-    **ADDITIONAL CAPABILITIES:**
-    You now have access to external functions that can help gather additional context for the claim.
-    Based on the transcript, you should consider calling these functions if the information would be helpful:
+    logger.info("Starting incident analysis with function calling")
 
-    Available Functions:
-    {json.dumps([{k: {kk: vv for kk, vv in v.items() if kk != 'function'}} for k, v in AVAILABLE_FUNCTIONS.items()], indent=2)}
+    llm = get_llm(api_key=api_key, model=model, temperature=temperature)
 
-    **IMPORTANT:**
-    1. First, extract all the basic incident information from the transcript
-    2. Then determine which functions (if any) would provide helpful additional context
-    3. For each function you want to call, include a "function_calls" section in your response
-    4. I will execute the functions and provide you with the results
-    5. You will then incorporate those results into your final analysis
-
-    **TRANSCRIPT TO ANALYZE:**
-    <transcript>
-    {transcript}
-    </transcript>
-
-    Please provide your initial analysis and specify any function calls you'd like to make.
-    """
-
-    # First pass - get initial analysis and any function calls
-    response = llm.chat.completions.create(
-        messages=[
-            {
-                "role": "system",
-                "content": "You are an expert automotive claims adjuster analyzing vehicle damage with access to external data sources.",
-            },
-            {"role": "user", "content": prompt_text},
-        ],
-        response_format={
-            "type": "json_object",
-            "schema": IncidentAnalysis.model_json_schema(),
+    messages = [
+        _SYSTEM_MESSAGE,
+        {
+            "role": "user",
+            "content": f"{_PROMPT_PREFIX}{transcript}{_PROMPT_SUFFIX}",
         },
-        temperature=APP_STEPS_CONFIGS.incident_response.temperature,
-    )
-
-    # Parse initial response
-    incident_data = IncidentAnalysis.model_validate_json(
-        response.choices[0].message.content
+    ]
+    # The first turn is unconstrained so the model is free to request tools; a
+    # schema-constrained response_format would force it to answer in JSON instead
+    response = llm.chat.completions.create(
+        messages=messages,
+        tools=TOOL_SPECS,
+        tool_choice="auto",
+        temperature=temperature,
     )
+    message = response.choices[0].message
 
-    print("Initial analysis complete. Checking for function calls...")
-
-    function_calls_to_make = []
+    function_results = []
     external_data = {}
+    incident_data = None
 
-    # Making it more robust by checking for necessary inputs
-    if (
-        incident_data.date_location.date
-        and incident_data.date_location.location
-        and incident_data.date_location.date.lower()
-        not in ["not specified", "unknown", ""]
-    ):
-        function_calls_to_make.append(
+    if message.tool_calls:
+        calls = [
             {
-                "name": "weather_lookup",
-                "params": {
-                    "date": incident_data.date_location.date,
-                    "location": incident_data.date_location.location,
-                },
+                "id": tool_call.id,
+                "name": tool_call.function.name,
+                "params": _parse_tool_arguments(tool_call.function.arguments),
             }
+            for tool_call in message.tool_calls
+        ]
+
+        logger.info(
+            "Executing %d function calls: %s",
+            len(calls),
+            ", ".join(call["name"] for call in calls),
         )
+        function_results = execute_function_calls(calls)
 
-    if (
-        incident_data.parties_involved.other_driver_name
-        and incident_data.parties_involved.other_driver_name.lower()
-        not in ["information not provided", "not specified", ""]
-    ):
-        function_calls_to_make.append(
+        messages.append(
             {
-                "name": "driver_record_check",
-                "params": {
-                    "driver_name": incident_data.parties_involved.other_driver_name,
-                    "license_plate": incident_data.parties_involved.other_driver_vehicle,
-                },
+                "role": "assistant",
+                "content": message.content or "",
+                "tool_calls": [
+                    {
+                        "id": call["id"],
+                        "type": "function",
+                        "function": {
+                            "name": call["name"],
+                            "arguments": orjson.dumps(call["params"]).decode(),
+                        },
+                    }
+                    for call in calls
+                ],
             }
         )
-
-    # Execute tool calls
-    function_results = []
-    if function_calls_to_make:
-        print(f"Executing {len(function_calls_to_make)} function calls...")
-
-        for call in function_calls_to_make:
-            print(f"  - Calling {call['name']}...")
-            result = execute_function_call(call["name"], call["params"])
-            function_results.append(result)
-
+        for call, result in zip(calls, function_results):
             if result.status == "success":
                 external_data[call["name"]] = result.result
-
-    incident_data.function_calls_made = function_results
-    incident_data.external_data_retrieved = external_data
-
-    # Update analysis with external data pulled from tools
-    if function_results:
-        print("Incorporating external data into final analysis...")
-
-        enhancement_prompt = f"""
-        Based on the initial incident analysis and the additional data retrieved from external sources,
-        please provide an enhanced analysis that incorporates this new information.
-
-        **INITIAL ANALYSIS:**
-        {incident_data.model_dump_json(indent=2)}
-
-        **EXTERNAL DATA RETRIEVED:**
-        {json.dumps(external_data, indent=2)}
-
-        Please update your analysis to incorporate insights from this external data where relevant.
-        For example:
-        - Weather conditions might affect fault assessment
-        - Other traffic incidents might provide context
-        - Driver record might influence risk assessment
-        - Medical facility info might be relevant for injury cases
-
-        Provide the complete updated analysis.
-        """
-
-        enhanced_response = llm.chat.completions.create(
-            messages=[
+            messages.append(
                 {
-                    "role": "system",
-                    "content": "You are an expert automotive claims adjuster incorporating external data into your analysis.",
-                },
-                {"role": "user", "content": enhancement_prompt},
-            ],
-            response_format={
-                "type": "json_object",
-                "schema": IncidentAnalysis.model_json_schema(),
-            },
-            temperature=APP_STEPS_CONFIGS.incident_response.temperature,
-        )
+                    "role": "tool",
+                    "tool_call_id": call["id"],
+                    "content": result.model_dump_json(),
+                }
+            )
 
-        enhanced_data = IncidentAnalysis.model_validate_json(
-            enhanced_response.choices[0].message.content
+        logger.info("Incorporating external data into final analysis")
+    elif message.content:
+        # No tools requested: the first answer is usually already valid JSON
+        try:
+            incident_data = IncidentAnalysis.model_validate_json(message.content)
+        except ValidationError:
+            logger.info("First response did not match the schema, retrying with it")
+
+    if incident_data is None:
+        # Constrain the answer to the schema after tool results, or if the first
+        # answer was not valid
+        response = llm.chat.completions.create(
+            messages=messages,
+            response_format=_RESPONSE_FORMAT,
+            temperature=temperature,
         )
+        incident_data = IncidentAnalysis.model_validate_json(
+            response.choices[0].message.content
+        )
+    incident_data.function_calls_made = function_results
+    incident_data.external_data_retrieved = external_data
 
-        enhanced_data.function_calls_made = function_results
-        enhanced_data.external_data_retrieved = external_data
-        incident_data = enhanced_data
+    _INCIDENT_ANALYSIS_CACHE.set(cache_key, incident_data)
 
-    print("Finished incident analysis with function calling.")
+    logger.info("Finished incident analysis with function calling")
     return incident_data
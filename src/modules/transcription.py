@@ -1,22 +1,40 @@
-import json
+import bisect
+import logging
+import queue
 import threading
-import time
 import urllib.parse
 from typing import Optional, Callable
+import orjson
 import websocket
 
+logger = logging.getLogger(__name__)
+
+# Queued in place of audio to tell a sender thread to exit
+_STOP_SENDING = object()
+
 
 class FireworksTranscription:
     """Fireworks AI transcription for Gradio integration."""
 
     WEBSOCKET_URL = "ws://audio-streaming.us-virginia-1.direct.fireworks.ai/v1/audio/transcriptions/streaming"
+    # PCM format the streaming endpoint expects: 16 kHz mono int16
+    TARGET_SAMPLE_RATE = 16000
+    # Audio chunks waiting to be sent (~4 s at the app's 500 ms stream interval)
+    SEND_QUEUE_SIZE = 8
 
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.websocket_client = None
         self.is_connected = False
-        self.segments = {}
-        self.lock = threading.Lock()
+        self._connected_event = threading.Event()
+        self._send_queue = queue.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        self._sender_thread = None
+        self._sender_lock = threading.Lock()
+        # Segment ids in ascending order, with their texts in the parallel list
+        self._segment_ids = []
+        self._segment_texts = []
+        self._complete_text = ""
+        self._text_dirty = False
         self.transcription_callback: Optional[Callable[[str], None]] = None
 
     def set_callback(self, callback: Callable[[str], None]):
@@ -26,6 +44,12 @@ class FireworksTranscription:
     def _connect(self) -> bool:
         """Connect to Fireworks WebSocket."""
         try:
+            # Never carry audio or a sender over from a previous connection
+            if self.websocket_client is not None:
+                self.close()
+            self._connected_event.clear()
+            self._send_queue = queue.Queue(maxsize=self.SEND_QUEUE_SIZE)
+
             params = urllib.parse.urlencode({"language": "en"})
             full_url = f"{self.WEBSOCKET_URL}?{params}"
 
@@ -35,78 +59,168 @@ class FireworksTranscription:
                 on_open=self._on_open,
                 on_message=self._on_message,
                 on_error=self._on_error,
+                on_close=self._on_close,
             )
 
-            # Start WebSocket in background thread
+            # Start WebSocket in background thread. Server messages are small JSON
+            # payloads, so skip websocket-client's pure-Python UTF-8 validator.
             ws_thread = threading.Thread(
-                target=self.websocket_client.run_forever, daemon=True
+                target=self.websocket_client.run_forever,
+                kwargs={"skip_utf8_validation": True},
+                daemon=True,
             )
             ws_thread.start()
 
-            # Wait for connection (max 5 seconds)
-            timeout = 5
-            start_time = time.time()
-            while not self.is_connected and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
+            # Socket writes happen on their own thread so a slow send never blocks
+            # the audio callback
+            self._sender_thread = threading.Thread(
+                target=self._send_loop,
+                args=(self.websocket_client, self._send_queue),
+                daemon=True,
+            )
+            self._sender_thread.start()
 
+            # Wait for connection (max 5 seconds)
+            self._connected_event.wait(timeout=5)
             return self.is_connected
 
         except Exception as e:
-            print(f"Connection error: {e}")
+            logger.error("Connection error: %s", e)
             return False
 
     def _send_audio_chunk(self, chunk: bytes) -> bool:
-        """Send audio chunk to Fireworks."""
+        """Queue an audio chunk to be sent to Fireworks."""
         if not self.is_connected or not self.websocket_client:
             return False
 
         try:
-            self.websocket_client.send(chunk, opcode=websocket.ABNF.OPCODE_BINARY)
+            self._send_queue.put_nowait(chunk)
             return True
-        except Exception as e:
-            print(f"Error sending audio chunk: {e}")
+        except queue.Full:
+            logger.warning("Audio send queue full, dropping chunk")
             return False
 
+    def close(self):
+        """Stop sending audio and close the WebSocket."""
+        self.is_connected = False
+        self._connected_event.clear()
+        self._stop_sender()
+        if self.websocket_client is not None:
+            self.websocket_client.close()
+
+    def _stop_sender(self):
+        """Discard queued audio and tell the sender thread to exit."""
+        with self._sender_lock:
+            if self._sender_thread is None:
+                return
+            self._drain_send_queue()
+            # The queue was just drained and nothing new is accepted, so this never blocks
+            self._send_queue.put(_STOP_SENDING)
+            self._sender_thread = None
+
+    def _drain_send_queue(self):
+        """Discard any audio still waiting to be sent."""
+        try:
+            while True:
+                self._send_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _send_loop(self, websocket_client, send_queue: queue.Queue):
+        """Send queued audio chunks over one WebSocket connection."""
+        while True:
+            chunk = send_queue.get()
+            if chunk is _STOP_SENDING:
+                return
+            if not self.is_connected:
+                # Socket closed: drop whatever is still queued
+                continue
+            try:
+                websocket_client.send(chunk, opcode=websocket.ABNF.OPCODE_BINARY)
+            except websocket.WebSocketConnectionClosedException:
+                logger.warning("Transcription socket closed, dropping queued audio")
+                self.is_connected = False
+            except Exception as e:
+                logger.error("Error sending audio chunk: %s", e)
+
     def _on_open(self, ws):
         """Handle WebSocket connection opening."""
         self.is_connected = True
-        print("✅ Connected to Fireworks transcription service")
+        self._connected_event.set()
+        logger.info("Connected to Fireworks transcription service")
 
     def _on_message(self, ws, message):
         """Handle transcription messages from Fireworks."""
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
 
             # Process segments
             if "segments" in data:
-                with self.lock:
-                    # Update segments
-                    for segment in data["segments"]:
-                        segment_id = segment["id"]
-                        text = segment["text"]
-                        self.segments[segment_id] = text
-
-                    # Build complete current transcription
+                # Update segments. websocket-client dispatches every callback from
+                # the single run_forever thread, so segment state needs no lock.
+                changed = False
+                for segment in data["segments"]:
+                    if self._update_segment(int(segment["id"]), segment["text"]):
+                        changed = True
+
+                # Only rebuild and notify when the transcript actually changed
+                if changed and self.transcription_callback:
                     complete_text = self._build_complete_text()
-
-                    # Call callback with live update
-                    if self.transcription_callback and complete_text.strip():
+                    if complete_text.strip():
                         self.transcription_callback(complete_text)
 
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse message: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse message: %s", e)
         except Exception as e:
-            print(f"Error processing message: {e}")
+            logger.error("Error processing message: %s", e)
+
+    def _on_close(self, ws, close_status_code, close_msg):
+        """Handle the WebSocket closing."""
+        # A late close from a replaced connection must not touch the current one
+        if ws is not self.websocket_client:
+            return
+        self.is_connected = False
+        self._connected_event.clear()
+        self._stop_sender()
+        logger.info(
+            "Transcription connection closed: %s %s", close_status_code, close_msg
+        )
 
     @staticmethod
     def _on_error(ws, error):
         """Handle WebSocket errors."""
-        print(f"WebSocket error: {error}")
+        logger.error("WebSocket error: %s", error)
+
+    def _update_segment(self, segment_id: int, text: str) -> bool:
+        """Insert a new segment or replace the text of an existing one.
+
+        Returns True if the transcript changed.
+        """
+        # Whitespace-only segments are stored as "" so joins can skip them without
+        # re-stripping every segment
+        if not text.strip():
+            text = ""
+
+        index = bisect.bisect_left(self._segment_ids, segment_id)
+        if index < len(self._segment_ids) and self._segment_ids[index] == segment_id:
+            # The server re-emits unchanged segments; keep the cached text valid
+            if self._segment_texts[index] == text:
+                return False
+            self._segment_texts[index] = text
+        else:
+            self._segment_ids.insert(index, segment_id)
+            self._segment_texts.insert(index, text)
+            if not text:
+                # A new blank segment does not change the joined text
+                return False
+        self._text_dirty = True
+        return True
 
     def _build_complete_text(self) -> str:
-        """Build complete text from all segments."""
-        if not self.segments:
-            return ""
-
-        sorted_segments = sorted(self.segments.items(), key=lambda x: int(x[0]))
-        return " ".join(segment[1] for segment in sorted_segments if segment[1].strip())
+        """Build complete text from all segments, rejoining only after a change."""
+        if self._text_dirty:
+            # Blank segments are already "", so filter(None) drops them without
+            # scanning any text
+            self._complete_text = " ".join(filter(None, self._segment_texts))
+            self._text_dirty = False
+        return self._complete_text